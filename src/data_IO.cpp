@@ -18,6 +18,7 @@
 #include <ctime>
 #include <random>
 #include <algorithm>
+#include <array>
 #include <fstream>
 #include <sstream>
 #include "data_IO.h"
@@ -109,7 +110,13 @@ std::map< std::string, std::string > import_reference( std::string fastaFilePath
 
 	std::string line, currentRefName;
 	std::map< std::string, std::string > reference;
+	std::string *currentSeq = NULL;
 	int referencesInFile = 0;
+
+	/*lookup table for the grammar check, indexed by character */
+	std::array< bool, 256 > legalBase;
+	legalBase.fill( false );
+	for ( char c : std::string( "ATGCNURYKMSWBDHV" ) ) legalBase[ (unsigned char) c ] = true;
 	
 	/*while we have a line to read in the reference file... */
 	while ( std::getline( file, line ) ){
@@ -119,7 +126,8 @@ std::map< std::string, std::string > import_reference( std::string fastaFilePath
 
 			currentRefName = line.substr(1);
 			if ( currentRefName.find(' ') != std::string::npos ) currentRefName = currentRefName.substr(0, currentRefName.find(' '));
-			reference[currentRefName] = "";
+			currentSeq = &reference[currentRefName];
+			currentSeq -> clear();
 			referencesInFile++;
 		}
 		else {
@@ -131,12 +139,14 @@ std::map< std::string, std::string > import_reference( std::string fastaFilePath
 				/*ignire carriage returns */
 				if ( *it == '\r' ) continue;
 
-				if ( *it != 'A' and *it != 'T' and *it != 'G' and *it != 'C' and *it != 'N' and *it != 'U' and *it != 'R' and *it != 'Y' and *it != 'K' and *it != 'M' and *it != 'S' and *it != 'W' and *it != 'B' and *it != 'D' and *it != 'H' and *it != 'V' ){
+				if ( not legalBase[ (unsigned char) *it ] ){
 					std::cout << "Exiting with error.  Illegal character in reference file: " << *it << std::endl;
 					exit( EXIT_FAILURE );
 				}
 			}
-			reference[currentRefName] += line;
+			/*append through a pointer to the current sequence rather than looking it up in the map for every line */
+			if ( currentSeq == NULL ) currentSeq = &reference[currentRefName];
+			currentSeq -> append( line );
 		}
 	}
 
@@ -170,7 +180,7 @@ std::map< std::string, std::string > import_reference_pfasta( std::string fastaF
 		std::string chromosomeName(ps.name);
 		std::string chromosomeSeq(ps.seq);
 		std::transform( chromosomeSeq.begin(), chromosomeSeq.end(), chromosomeSeq.begin(), toupper );
-		reference[ chromosomeName ] = chromosomeSeq;
+		reference[ chromosomeName ] = std::move( chromosomeSeq );
 		pfasta_seq_free(&ps);
 	}
 
@@ -200,29 +210,51 @@ std::string getGitCommit(void){
 }
 
 
-std::map<std::string, int> base2index = {{"A",0}, {"T",1}, {"G",2}, {"C",3}};
+inline unsigned int base2index( char base ){
+
+	switch (base) {
+
+		case 'T': return 1;
+		case 'G': return 2;
+		case 'C': return 3;
+		default: return 0;
+	}
+}
 
 
 unsigned int sixMer2index(std::string &sixMer){
 
-	unsigned int p = 1;
+	/*base-4 encoding with the last base as the least significant digit */
 	unsigned int r = 0;
 	for (size_t i = 0; i < 6; i++){
 
-		r += base2index[sixMer.substr(6-i-1,1)] * p;
-		p *= 4;
+		r = (r << 2) | base2index(sixMer[i]);
 	}
 	return r;
 }
 
 
+std::string index2sixMer(unsigned int index){
+
+	/*inverse of sixMer2index */
+	static const char bases[] = {'A', 'T', 'G', 'C'};
+	std::string sixMer(6, 'A');
+	for (size_t i = 0; i < 6; i++){
+
+		sixMer[6-i-1] = bases[index & 3];
+		index >>= 2;
+	}
+	return sixMer;
+}
+
+
 std::vector< std::pair< double, double > > import_poreModel( std::string poreModelFilename ){
 
 	std::string pathExe = getExePath();
 	std::string modelPath = pathExe + "/pore_models/" + poreModelFilename;
 
-	/*map that sends a 5mer or 6mer to the characteristic mean and standard deviation (a pair) */
-	std::map< std::string, std::pair< double, double > > kmer2MeanStd;
+	/*vector indexed by sixMer2index that sends a 6mer to the characteristic mean and standard deviation (a pair) */
+	std::vector< std::pair< double, double > > indexedPoreModel(4096, std::make_pair(0,0));
 
 	/*file handle, and delimiter between columns (a \t character in the case of ONT model files) */
 	std::ifstream file( modelPath );
@@ -247,22 +279,10 @@ std::vector< std::pair< double, double > > import_poreModel( std::string poreMod
 
 			std = line.substr( 0, line.find( delim ) );
 
-			/*key the map by the kmer, and convert the mean and std strings to doubles */
-			kmer2MeanStd[ key ] = std::make_pair( atof( mean.c_str() ), atof( std.c_str() ) );
+			/*index by the kmer, and convert the mean and std strings to doubles */
+			indexedPoreModel[ sixMer2index( key ) ] = std::make_pair( atof( mean.c_str() ), atof( std.c_str() ) );
 		}
 	}
 
-	std::vector< std::pair< double, double > > indexedPoreModel(4096, std::make_pair(0,0));
-
-	for(auto it = kmer2MeanStd.cbegin(); it != kmer2MeanStd.cend(); ++it){
-
-		std::string sixMer = it -> first;
-		kmer2MeanStd[sixMer] = std::make_pair(it->second.first, it->second.second);
-
-		indexedPoreModel[sixMer2index(sixMer)] = std::make_pair(it->second.first, it->second.second);
-
-	    //std::cout << it->first << " " << it->second.first << " " << it->second.second << "\n";
-	}
-
 	return indexedPoreModel;
 }
@@ -78,6 +78,7 @@ std::string getGitCommit(void);
 std::string writeDetectHeader(std::string, std::string, std::string, int, bool, unsigned int, unsigned int, double, bool);
 std::string writeRegionsHeader(std::string, double, bool, unsigned int, unsigned int, double, double);
 unsigned int sixMer2index(std::string &);
+std::string index2sixMer(unsigned int);
 
 
 #endif
@@ -193,9 +193,26 @@ double sequenceProbability( std::vector <double> &observations,
 	}
 
 
+	/*-----------EMISSIONS----------- */
+	//the pore model parameters at each position don't depend on the observation, so look them up once here rather than in the recursion
+	std::vector< std::pair< double, double > > levelMuSigma( I_curr.size() );
+	for ( unsigned int i = 0; i < I_curr.size(); i++ ){
+
+		std::string sixMer = sequence.substr(i, 6);
+		unsigned int sixMerIndex = sixMer2index(sixMer);
+		std::pair<double,double> meanStd = thymidineModel[sixMerIndex];
+
+		if ( i > 0 and useBrdU and BrdUStart <= i and i <= BrdUEnd and sixMer.find('T') != std::string::npos and analogueModel[sixMerIndex].first != 0. ){
+
+			meanStd = analogueModel[sixMerIndex];
+		}
+
+		levelMuSigma[i] = std::make_pair( scalings.shift + scalings.scale * meanStd.first, scalings.var * meanStd.second );
+	}
+
+
 	/*-----------RECURSION----------- */
 	/*complexity is O(T*N^2) where T is the number of observations and N is the number of states */
-	double level_mu, level_sigma;
 	for ( unsigned int t = 0; t < observations.size(); t++ ){
 
 		std::fill( I_curr.begin(), I_curr.end(), NAN );
@@ -203,18 +220,7 @@ double sequenceProbability( std::vector <double> &observations,
 		std::fill( D_curr.begin(), D_curr.end(), NAN );
 		firstI_curr = NAN;
 
-		std::string sixMer = sequence.substr(0, 6);
-
-		std::pair<double,double> meanStd = thymidineModel[sixMer2index(sixMer)];
-		level_mu = scalings.shift + scalings.scale * meanStd.first;
-		level_sigma = scalings.var * meanStd.second;
-
-		//uncomment to scale events
-		//level_mu = thymidineModel.at(sixMer).first;
-		//level_sigma = scalings.var / scalings.scale * thymidineModel.at(sixMer).second;
-		//observations[t] = (observations[t] - scalings.shift) / scalings.scale;
-
-		matchProb = eln( normalPDF( level_mu, level_sigma, observations[t] ) );
+		matchProb = eln( normalPDF( levelMuSigma[0].first, levelMuSigma[0].second, observations[t] ) );
 		insProb = eln( uniformPDF( 0, 250, observations[t] ) );
 
 		//first insertion
@@ -237,33 +243,8 @@ double sequenceProbability( std::vector <double> &observations,
 		//the rest of the sequence
 		for ( unsigned int i = 1; i < I_curr.size(); i++ ){
 
-			//get model parameters
-			sixMer = sequence.substr(i, 6);
-			std::pair<double,double> analogue_meanStd = analogueModel[sixMer2index(sixMer)];
 			insProb = eln( uniformPDF( 0, 250, observations[t] ) );
-			if ( useBrdU and BrdUStart <= i and i <= BrdUEnd and sixMer.find('T') != std::string::npos and analogue_meanStd.first != 0. ){
-
-				level_mu = scalings.shift + scalings.scale * analogue_meanStd.first;
-				level_sigma = scalings.var * analogue_meanStd.second;
-
-				//uncomment if you scale events
-				//level_mu = analogueModel.at(sixMer).first;
-				//level_sigma = scalings.var / scalings.scale * analogueModel.at(sixMer).second;
-
-				matchProb = eln( normalPDF( level_mu, level_sigma, observations[t] ) );
-			}
-			else{
-
-				std::pair<double,double> meanStd = thymidineModel[sixMer2index(sixMer)];
-				level_mu = scalings.shift + scalings.scale * meanStd.first;
-				level_sigma = scalings.var * meanStd.second;
-
-				//uncomment if you scale events
-				//level_mu = thymidineModel.at(sixMer).first;
-				//level_sigma = scalings.var / scalings.scale * thymidineModel.at(sixMer).second;
-
-				matchProb = eln( normalPDF( level_mu, level_sigma, observations[t] ) );
-			}
+			matchProb = eln( normalPDF( levelMuSigma[i].first, levelMuSigma[i].second, observations[t] ) );
 
 			//to the insertion
 			I_curr[i] = lnSum( I_curr[i], lnProd( lnProd( I_prev[i], internalI2I ), insProb ) );  //I to I
@@ -796,7 +777,7 @@ std::string runCNN(std::shared_ptr<AlignedRead> r, std::shared_ptr<ModelSession>
 		if((i+1)%outputFields==0){
 
 			//only output T positions
-			if (sixMers[pos].substr(0,1) != "T"){
+			if (sixMers[pos][0] != 'T'){
 				pos++;
 				continue;
 			}
@@ -887,7 +868,7 @@ std::map<unsigned int, std::pair<double,double>> runCNN_training(std::shared_ptr
 		if((i+1)%outputFields==0){
 
 			//only output T positions
-			if (sixMers[pos].substr(0,1) != "T"){
+			if (sixMers[pos][0] != 'T'){
 				pos++;
 				continue;
 			}
@@ -950,6 +931,9 @@ int detect_main( int argc, char** argv ){
 	bam_fh = sam_open((args.bamFilename).c_str(), "r");
 	if (bam_fh == NULL) throw IOerror(args.bamFilename);
 
+	//decompress BGZF blocks on a thread pool so the single reader loop isn't bound on inflate
+	if (args.threads > 1) hts_set_threads(bam_fh, args.threads);
+
 	//load the index
 	bam_idx = sam_index_load(bam_fh, (args.bamFilename).c_str());
 	if (bam_idx == NULL) throw IOerror("index for "+args.bamFilename);
@@ -984,12 +968,7 @@ int detect_main( int argc, char** argv ){
 		result = sam_itr_next(bam_fh, itr, record);
 
 		//add the record to the buffer if it passes the user's criteria, otherwise destroy it cleanly
-		int mappingQual = record -> core.qual;
-		int refStart,refEnd;
-		getRefEnd(record,refStart,refEnd);
-		int queryLen = record -> core.l_qseq;
-
-		if ( mappingQual >= args.minQ and refEnd - refStart >= args.minL and queryLen != 0 ){
+		if ( result >= 0 and passesFilters(record, args.minQ, args.minL) ){
 
 			buffer.push_back( record );
 		}
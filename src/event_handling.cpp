@@ -52,6 +52,26 @@ float fast5_read_float_attribute(hid_t group, const char *attribute) {
 //end scrappie
 
 
+float *signalBuffer( hsize_t nsample ){
+/*per-thread buffer that raw signal is read into, only reallocated when a read has more samples than any seen before on this thread */
+
+	static thread_local std::vector< float > buffer;
+	if ( buffer.size() < nsample ) buffer.resize(nsample);
+	return buffer.data();
+}
+
+
+hid_t openSignalDataset( hid_t hdf5_file, std::string &signal_path ){
+/*opens the raw signal with a chunk cache large enough to hold the whole compressed dataset, so no chunk is decompressed more than once */
+
+	hid_t dapl = H5Pcreate(H5P_DATASET_ACCESS);
+	H5Pset_chunk_cache(dapl, 10007, 32*1024*1024, 1.0);
+	hid_t dset = H5Dopen(hdf5_file, signal_path.c_str(), dapl);
+	H5Pclose(dapl);
+	return dset;
+}
+
+
 void bulk_getEvents( std::string fast5Filename, std::string readID, std::vector<double> &raw, float &sample_rate ){
 
 	//open the file
@@ -71,31 +91,34 @@ void bulk_getEvents( std::string fast5Filename, std::string readID, std::vector<
 	hid_t space;
 	hsize_t nsample;
 	float raw_unit;
-	float *rawptr = NULL;
 
 	std::string signal_path = "/read_" + readID + "/Raw/Signal";
-	hid_t dset = H5Dopen(hdf5_file, signal_path.c_str(), H5P_DEFAULT);
-	if (dset < 0 ) throw BadFast5Field(); 
+	hid_t dset = openSignalDataset(hdf5_file, signal_path);
+	if (dset < 0 ){
+		H5Fclose(hdf5_file);
+		throw BadFast5Field();
+	}
 	space = H5Dget_space(dset);
-	if (space < 0 ) throw BadFast5Field(); 
-	H5Sget_simple_extent_dims(space, &nsample, NULL);
-   	rawptr = (float*)calloc(nsample, sizeof(float));
-    	herr_t status = H5Dread(dset, H5T_NATIVE_FLOAT, H5S_ALL, H5S_ALL, H5P_DEFAULT, rawptr);
-	if ( status < 0 ){
-		free(rawptr);
+	if (space < 0 ){
 		H5Dclose(dset);
-		return;
+		H5Fclose(hdf5_file);
+		throw BadFast5Field();
 	}
+	H5Sget_simple_extent_dims(space, &nsample, NULL);
+	H5Sclose(space);
+	float *rawptr = signalBuffer(nsample);
+	herr_t status = H5Dread(dset, H5T_NATIVE_FLOAT, H5S_ALL, H5S_ALL, H5P_DEFAULT, rawptr);
+
+	//close the file as soon as the signal is read, including on failure, so no handles are left open between reads
 	H5Dclose(dset);
+	H5Fclose(hdf5_file);
+	if ( status < 0 ) return;
 	
+	//convert the whole buffer to pA in one pass over a pre-sized vector rather than growing it sample by sample
 	raw_unit = range / digitisation;
-	raw.reserve(nsample);
-	for ( size_t i = 0; i < nsample; i++ ){
-
-		raw.push_back( (rawptr[i] + offset) * raw_unit );
-	}
-	free(rawptr);
-	H5Fclose(hdf5_file);
+	size_t rawStart = raw.size();
+	raw.resize( rawStart + nsample );
+	std::transform( rawptr, rawptr + nsample, raw.begin() + rawStart, [offset, raw_unit](float sample) -> float { return (sample + offset) * raw_unit; } );
 }
 
 
@@ -118,7 +141,6 @@ void getEvents( std::string fast5Filename, std::vector<double> &raw, float &samp
 	hid_t space;
 	hsize_t nsample;
 	float raw_unit;
-	float *rawptr = NULL;
 
 	ssize_t size = H5Lget_name_by_idx(hdf5_file, "/Raw/Reads/", H5_INDEX_NAME, H5_ITER_INC, 0, NULL, 0, H5P_DEFAULT);
 	char* name = (char*)calloc(1 + size, sizeof(char));
@@ -127,101 +149,32 @@ void getEvents( std::string fast5Filename, std::vector<double> &raw, float &samp
 	free(name);
 	std::string signal_path = "/Raw/Reads/" + readName + "/Signal";
 
-	hid_t dset = H5Dopen(hdf5_file, signal_path.c_str(), H5P_DEFAULT);
-	if (dset < 0 ) throw BadFast5Field(); 
+	hid_t dset = openSignalDataset(hdf5_file, signal_path);
+	if (dset < 0 ){
+		H5Fclose(hdf5_file);
+		throw BadFast5Field();
+	}
 	space = H5Dget_space(dset);
-	if (space < 0 ) throw BadFast5Field(); 
-	H5Sget_simple_extent_dims(space, &nsample, NULL);
-   	rawptr = (float*)calloc(nsample, sizeof(float));
-    	herr_t status = H5Dread(dset, H5T_NATIVE_FLOAT, H5S_ALL, H5S_ALL, H5P_DEFAULT, rawptr);
-	if ( status < 0 ){
-		free(rawptr);
+	if (space < 0 ){
 		H5Dclose(dset);
-		return;
+		H5Fclose(hdf5_file);
+		throw BadFast5Field();
 	}
-	H5Dclose(dset);
-	
-	raw_unit = range / digitisation;
-	for ( size_t i = 0; i < nsample; i++ ){
+	H5Sget_simple_extent_dims(space, &nsample, NULL);
+	H5Sclose(space);
+	float *rawptr = signalBuffer(nsample);
+	herr_t status = H5Dread(dset, H5T_NATIVE_FLOAT, H5S_ALL, H5S_ALL, H5P_DEFAULT, rawptr);
 
-		raw.push_back( (rawptr[i] + offset) * raw_unit );
-	}
-	free(rawptr);
+	//close the file as soon as the signal is read, including on failure, so no handles are left open between reads
+	H5Dclose(dset);
 	H5Fclose(hdf5_file);
-}
-
-
-std::vector< double > solveLinearSystem( std::vector< std::vector< double > > A, std::vector< double > b ){
-/*crude but functional algorithm that solves the linear system A*x = b by building an augmented matrix and transforming to reduced row echelon form */
+	if ( status < 0 ) return;
 	
-	if ( A.size() != b.size() ) throw MismatchedDimensions();
-
-	int lead = 0;
-
-	for ( unsigned int i = 0; i < A.size(); i++ ){
-
-		A[i].push_back( b[i] );
-	}
-
-	int nRows = A.size() - 1;
-	int nCols = A[0].size() - 1;
-
-	for ( int r = 0; r <= nRows; ++r ){
-
-		if ( lead > nCols ){
-			break;
-		}
-
-		int i = r;
-
-		while ( A[i][lead] == 0 ){
-			
-			++i;
-
-			if ( i > nRows ){
-			
-				i = r;
-				++lead;
-				if ( lead > nCols ){
-					goto stop;
-				}
-			}
-		}
-
-		std::vector< std::vector< double > > B = A;
-		A[i] = B[r];
-		A[r] = B[i];
-
-		double normaliser = A[r][lead];
-		if ( A[r][lead] != 0 ){
-			
-			for ( int c = 0; c <= nCols; ++c ){
-
-				A[r][c] /= normaliser;
-			}
-		}
-
-		for ( int i = 0; i <= nRows; ++i ){
-
-			if ( i != r ){
-				normaliser = A[i][lead];
-				for ( int c = 0; c <= nCols; ++c ){ 
-					A[i][c] -= normaliser*A[r][c];
-				}
-			}
-		}
-		lead++;
-	}
-
-	stop:
-	std::vector< double > result;
-	result.reserve( A.size() );
-
-	for ( unsigned int i = 0; i < A.size(); i++ ){
-
-		result.push_back( A[i].back() );
-	}
-	return result;
+	//convert the whole buffer to pA in one pass over a pre-sized vector rather than growing it sample by sample
+	raw_unit = range / digitisation;
+	size_t rawStart = raw.size();
+	raw.resize( rawStart + nsample );
+	std::transform( rawptr, rawptr + nsample, raw.begin() + rawStart, [offset, raw_unit](float sample) -> float { return (sample + offset) * raw_unit; } );
 }
 
 
@@ -259,6 +212,7 @@ void adaptive_banded_simple_event_align( std::vector< double > &raw, read &r, Po
 	//initialise vectors to solve A*x = b to recompute shift and scale
 	std::vector< std::vector< double > > A(2, std::vector<double>(2,0.0));
 	std::vector< double > b(2,0.0);
+	double weightedEventSq = 0.0;
 	PoreParameters rescale;
 
 	size_t k = 6;
@@ -488,13 +442,16 @@ void adaptive_banded_simple_event_align( std::vector< double > &raw, read &r, Po
 		eventDiffs += meanStd.first - raw[curr_event_idx];
 
 		//update A,b for recomputing shift and scale
-		//only do this for sixmers that don't contain a T
+		//weight each term by the inverse variance once rather than calling pow for every accumulator
+		double w = 1.0 / ( meanStd.second * meanStd.second );
+		double wMu = w * meanStd.first;
 
-		A[0][0] += 1.0 / pow( meanStd.second, 2.0 );
-		A[0][1] += meanStd.first / pow( meanStd.second, 2.0 );
-		A[1][1] += pow( meanStd.first, 2.0 ) / pow( meanStd.second, 2.0 );
-		b[0] += raw[curr_event_idx] / pow( meanStd.second, 2.0 );
-		b[1] += raw[curr_event_idx] * meanStd.first / pow( meanStd.second, 2.0 );
+		A[0][0] += w;
+		A[0][1] += wMu;
+		A[1][1] += wMu * meanStd.first;
+		b[0] += w * raw[curr_event_idx];
+		b[1] += wMu * raw[curr_event_idx];
+		weightedEventSq += w * raw[curr_event_idx] * raw[curr_event_idx];
 
 		n_aligned_events += 1;
 
@@ -536,29 +493,21 @@ void adaptive_banded_simple_event_align( std::vector< double > &raw, read &r, Po
 	}
 	else{
 
-		//solve the linear system
+		//solve the linear system - A is symmetric 2x2 so use the closed form rather than row reduction
 		A[1][0] = A[0][1];
-		std::vector< double > x =  solveLinearSystem(A, b);
-		rescale.shift = x[0];
-		rescale.scale = x[1];
-
-		//compute var
-		rescale.var = 0.0;
-		//int nNormalised = 0;
-		for (unsigned int i = 0; i < r.eventAlignment.size(); i++){
-
-			unsigned int kmer_rank = kmer_ranks[r.eventAlignment[i].second];
-			std::pair<double,double> meanStd = thymidineModel[kmer_rank];
-			//if (sixMer.find("T") != std::string::npos) continue;
-			double event = raw[r.eventAlignment[i].first];
-			double mu,stdv;
-			mu = meanStd.first;
-			stdv = meanStd.second;
-
-			double yi = (event - rescale.shift - rescale.scale*mu);
-			rescale.var += yi * yi / (stdv * stdv);
-		}
-		rescale.var /= raw.size();//(double) nNormalised;
+		double det = A[0][0] * A[1][1] - A[0][1] * A[1][0];
+		rescale.shift = ( A[1][1] * b[0] - A[0][1] * b[1] ) / det;
+		rescale.scale = ( A[0][0] * b[1] - A[1][0] * b[0] ) / det;
+
+		//compute var from the accumulators by expanding sum_i (event_i - shift - scale*mu_i)^2 / stdv_i^2, so the alignment isn't traversed a second time
+		rescale.var = weightedEventSq
+		            - 2.0 * rescale.shift * b[0]
+		            - 2.0 * rescale.scale * b[1]
+		            + rescale.shift * rescale.shift * A[0][0]
+		            + 2.0 * rescale.shift * rescale.scale * A[0][1]
+		            + rescale.scale * rescale.scale * A[1][1];
+		rescale.var = std::max( rescale.var, 0.0 );
+		rescale.var /= raw.size();
 		rescale.var = sqrt(rescale.var);
 		//fprintf(stderr,"%f\n",rescale.var);
 	}
@@ -1438,8 +1438,8 @@ KMeansResult estimateAnalogueIncorporation(std::string detectFilename, int readC
 	
 	while( std::getline( inFile, line ) ){
 
-		if (line.substr(0,1) == "#") continue; //ignore header
-		if ( line.substr(0,1) == ">" ){
+		if (line[0] == '#') continue; //ignore header
+		if ( line[0] == '>' ){
 
 			progress++;
 			pb.displayProgress( progress, 0, 0 );
@@ -1531,7 +1531,7 @@ int sense_main( int argc, char** argv ){
 	if ( not inFile.is_open() ) throw IOerror( args.detectFilename );
 	while( std::getline( inFile, line ) ){
 
-		if ( line.substr(0,1) == ">" ) readCount++;
+		if ( line[0] == '>' ) readCount++;
 	}	
 	progressBar pb(readCount,true);
 	inFile.close();
@@ -1552,10 +1552,10 @@ int sense_main( int argc, char** argv ){
 	int progress = 0;
 	while( std::getline( inFile, line ) ){
 
-		if ( line.substr(0,1) == "#"){
+		if ( line[0] == '#'){
 			continue;
 		}
-		else if ( line.substr(0,1) == ">" ){
+		else if ( line[0] == '>' ){
 
 			//check the read length on the back of the buffer
 			if (readBuffer.size() > 0){
@@ -15,24 +15,32 @@ void countRecords( htsFile *bam_fh, hts_idx_t *bam_idx, bam_hdr_t *bam_hdr, int
 
 	std::cout << "Scanning bam file...";
 	hts_itr_t* itr = sam_itr_querys(bam_idx,bam_hdr,".");
-	int result;
-
-	do {
-		bam1_t *record = bam_init1();
-		result = sam_itr_next(bam_fh, itr, record);
-		int refStart,refEnd;
-		getRefEnd(record,refStart,refEnd);
-		int queryLen = record -> core.l_qseq;
-		if ( (record -> core.qual >= minQ) and (refEnd - refStart >= minL) and queryLen != 0) numOfRecords++;
-		bam_destroy1(record);
-	} while (result > 0);
+
+	//reuse one record for the whole scan
+	bam1_t *record = bam_init1();
+	while ( sam_itr_next(bam_fh, itr, record) >= 0 ){
+
+		if ( passesFilters(record, minQ, minL) ) numOfRecords++;
+	}
 
 	//cleanup
+	bam_destroy1(record);
 	sam_itr_destroy(itr);
 	std::cout << "ok." << std::endl;
 }
 
 
+bool passesFilters(bam1_t *record, int minQ, int minL ){
+
+	//check the fields in the core record first and only walk the cigar string for reads that pass them
+	if ( record -> core.qual < minQ or record -> core.l_qseq == 0 ) return false;
+
+	int refStart,refEnd;
+	getRefEnd(record,refStart,refEnd);
+	return refEnd - refStart >= minL;
+}
+
+
 bool indelFastFail(bam1_t *record, int maxI, int maxD ){
 	//Covered in: tests/detect/htslib
 
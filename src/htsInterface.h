@@ -20,6 +20,7 @@ void countRecords( htsFile *, hts_idx_t *, bam_hdr_t *, int &, int , int  );
 void parseCigar(bam1_t *, std::map< unsigned int, unsigned int > &, int &, int & );
 std::string getQuerySequence( bam1_t * );
 void getRefEnd(bam1_t *, int &, int & );
+bool passesFilters(bam1_t *, int, int );
 bool indelFastFail(bam1_t *, int, int );
 std::vector<int>  ref2indels(bam1_t *, int &, int & );
 
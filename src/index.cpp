@@ -88,63 +88,55 @@ Arguments parseIndexArguments( int argc, char** argv ){
 }
 
 
-void countFast5(std::string path, int &count){
+const char *get_ext(const char *filename){
 
-	tinydir_dir dir;
-	unsigned int i;
-	if (tinydir_open_sorted(&dir, path.c_str()) == -1){
-		std::string error = "Error opening directory: "+path;
-		perror(error.c_str());
-		goto fail;
-	}
+	const char *ext = strrchr(filename, '.');
+	if(!ext || ext == filename) return "";
+	return ext + 1;
+}
 
-	for (i = 0; i < dir.n_files; i++){
 
-		tinydir_file file;
-		if (tinydir_readfile_n(&dir, &file, i) == -1){
-			std::string error = "Error opening file in: "+path;
-			perror(error.c_str());
-			goto fail;
-		}
+bool visitedLaterInSortedWalk(const std::string &pathA, const std::string &pathB){
 
-		if (file.is_dir){
+	//true if pathA would come after pathB in a sorted walk of the directory tree (subdirectories before files, then by name)
+	//used to settle fast5 files with the same name the same way the sorted walk did, without depending on readdir order
+	size_t start = 0;
+	while (true){
 
-			if (strcmp(file.name,".") != 0 and strcmp(file.name,"..") != 0){
+		size_t endA = pathA.find('/', start);
+		size_t endB = pathB.find('/', start);
+		std::string compA = pathA.substr(start, endA - start);
+		std::string compB = pathB.substr(start, endB - start);
 
-				std::string newPath = path + "/" + file.name;
-				countFast5(newPath, count);
-			}
+		if (compA != compB or endA == std::string::npos or endB == std::string::npos){
+
+			bool isDirA = (endA != std::string::npos);
+			bool isDirB = (endB != std::string::npos);
+			if (isDirA != isDirB) return isDirB;
+			return compA > compB;
 		}
-		else count++;
+		start = endA + 1;
 	}
-
-	fail:
-	tinydir_close(&dir);
-}
-
-
-const char *get_ext(const char *filename){
-
-	const char *ext = strrchr(filename, '.');
-	if(!ext || ext == filename) return "";
-	return ext + 1;
 }
 
 
 void readDirectory(std::string path, std::map<std::string,std::string> &allfast5paths){
 
+	//stream the directory entries rather than reading and sorting them all up front
+	//fast5 files are keyed by name, so if a name turns up twice, keep the one the sorted walk would have visited last
 	tinydir_dir dir;
-	unsigned int i;
-	if (tinydir_open_sorted(&dir, path.c_str()) == -1){
+	if (tinydir_open(&dir, path.c_str()) == -1){
 		std::string error = "Error opening directory: "+path;
 		perror(error.c_str());
 		goto fail;
 	}
 
-	for (i = 0; i < dir.n_files; i++){
+	if (path.back() == '/') path.pop_back();
+
+	while (dir.has_next){
 
 		tinydir_file file;
-		if (tinydir_readfile_n(&dir, &file, i) == -1){
+		if (tinydir_readfile(&dir, &file) == -1){
 			std::string error = "Error opening file in: "+path;
 			perror(error.c_str());
 			goto fail;
@@ -154,9 +146,6 @@ void readDirectory(std::string path, std::map<std::string,std::string> &allfast5
 
 			if (strcmp(file.name,".") != 0 and strcmp(file.name,"..") != 0){
 
-				char &trail = path.back();
-				if (trail == '/') path.pop_back();
-
 				std::string newPath = path + "/" + file.name;
 				readDirectory(newPath, allfast5paths);
 			}
@@ -165,12 +154,13 @@ void readDirectory(std::string path, std::map<std::string,std::string> &allfast5
 			const char *ext = get_ext(file.name);
 			if ( strcmp(ext,"fast5") == 0 ){
 
-				char &trail = path.back();
-				if (trail == '/') path.pop_back();
-
-				allfast5paths[file.name] = path + "/" + file.name;
+				std::string fullPath = path + "/" + file.name;
+				auto found = allfast5paths.find(file.name);
+				if ( found == allfast5paths.end() ) allfast5paths[file.name] = fullPath;
+				else if ( visitedLaterInSortedWalk(fullPath, found -> second) ) found -> second = fullPath;
 			}
 		}
+		tinydir_next(&dir);
 	}
 
 	fail:
@@ -276,12 +266,6 @@ int index_main( int argc, char** argv ){
 
  	Arguments args = parseIndexArguments( argc, argv );
 
-	int totalFast5 = 0;
-	countFast5(args.fast5path.c_str(), totalFast5);
-
-	int progress = 0;
-	progressBar pb(totalFast5,false);
-
 	std::ofstream outFile( args.outfile );
 	if ( not outFile.is_open() ) throw IOerror( args.outfile );
 
@@ -292,8 +276,12 @@ int index_main( int argc, char** argv ){
 	bool isBulkFast5;
 	std::map<std::string,std::string> readID2fast5 = parseSequencingSummary(args.ssPath, isBulkFast5, args.GridION);
 
-	if (isBulkFast5) outFile << "#bulk" << std::endl;
-	else outFile << "#individual" << std::endl;
+	//progress is reported per read, so size the bar from the sequencing summary rather than a second walk of the fast5 directory
+	int progress = 0;
+	progressBar pb(readID2fast5.size(),false);
+
+	if (isBulkFast5) outFile << "#bulk\n";
+	else outFile << "#individual\n";
 
 	for (auto idpair = readID2fast5.begin(); idpair != readID2fast5.end(); idpair++){
 
@@ -311,7 +299,8 @@ int index_main( int argc, char** argv ){
 			throw MissingFast5(idpair->second);
 		}
 
-		outFile << idpair->first << "\t" << fast52fullpath.at(idpair->second) << std::endl;
+		//write through the stream buffer rather than flushing after every read
+		outFile << idpair->first << "\t" << fast52fullpath.at(idpair->second) << "\n";
 		progress++;
 		pb.displayProgress( progress, 0, 0 );
 	}
@@ -218,6 +218,9 @@ int data_main( int argc, char** argv ){
 	bam_fh = sam_open((args.bamFilename).c_str(), "r");
 	if (bam_fh == NULL) throw IOerror(args.bamFilename);
 
+	//decompress BGZF blocks on a thread pool so the single reader loop isn't bound on inflate
+	if (args.threads > 1) hts_set_threads(bam_fh, args.threads);
+
 	//load the index
 	bam_idx = sam_index_load(bam_fh, (args.bamFilename).c_str());
 	if (bam_idx == NULL) throw IOerror("index for "+args.bamFilename);
@@ -248,12 +251,7 @@ int data_main( int argc, char** argv ){
 		result = sam_itr_next(bam_fh, itr, record);
 
 		//add the record to the buffer if it passes the user's criteria, otherwise destroy it cleanly
-		int mappingQual = record -> core.qual;
-		int refStart,refEnd;		
-		getRefEnd(record,refStart,refEnd);
-		int queryLen = record -> core.l_qseq;
-
-		if ( mappingQual >= args.minQ and refEnd - refStart >= args.minL and queryLen != 0 ){
+		if ( result >= 0 and passesFilters(record, args.minQ, args.minL) ){
 
 			buffer.push_back( record );
 		}
@@ -345,30 +345,6 @@ std::vector< double > gaussianMixtureEM( double pi, double mu1, double sigma1, d
 }
 
 
-void printAllKLengthRec(char set[], std::string prefix, int n, int k, std::vector<std::string> &out){
-
-	//base case
-	if (k == 0){
-		out.push_back(prefix);
-		return;
-	}
-
-	//recursion 
-	for (int i = 0; i < n; i++){
-
-		std::string newPrefix;
-		newPrefix = prefix + set[i];
-		printAllKLengthRec(set, newPrefix, n, k - 1, out);
-	}
-}
-
-
-void printAllKLength(char set[], int k,int n, std::vector<std::string> &out){
-    
-	printAllKLengthRec(set, "", n, k, out);
-}
-
-
 int train_main( int argc, char** argv ){
 
 	Arguments trainArgs = parseTrainingArguments( argc, argv );
@@ -380,21 +356,7 @@ int train_main( int argc, char** argv ){
 	std::string line;
 	int prog, failed;
 
-	/*fudge for openmp */
-	char set1[] = {'A', 'T', 'G', 'C'};
-	int k = 6;
-	std::vector<std::string> allSixMers;
-	printAllKLength(set1, k, 4, allSixMers);
-	std::map< int, std::string > intToSixmer;
-	std::map< std::string, int > sixmerToInt;
-	int index = 0;
-	for ( unsigned int i = 0; i < allSixMers.size(); i++ ){
-
-		intToSixmer[index] = allSixMers[i];
-		sixmerToInt[allSixMers[i]] = index;
-		index++;
-	}
-
+	/*events are binned by sixMer2index, and only the 6mers that get fitted are decoded back to strings */
 	std::vector< std::vector< double > > importedEvents( 4096 );
 
 	//get a read count
@@ -403,7 +365,7 @@ int train_main( int argc, char** argv ){
 	if ( not eventFile.is_open() ) throw IOerror( trainArgs.eventalignFilename );
 	while( std::getline( eventFile, line ) ){
 
-		if ( line.substr(0,1) == ">" ) readCount++;
+		if ( line[0] == '>' ) readCount++;
 	}	
 	progressBar pb_read(std::min(readCount,trainArgs.maxReads),true);
 	eventFile.close();
@@ -416,7 +378,7 @@ int train_main( int argc, char** argv ){
 
 		if (line.empty()) continue;
 
-		if ( line.substr(0,1) == ">" ){
+		if ( line[0] == '>' ){
 
 			readsRead++;
 			pb_read.displayProgress( readsRead, 0, 0 );
@@ -444,9 +406,10 @@ int train_main( int argc, char** argv ){
 
 		assert (eventMean != 0.0);
 
-		if ( importedEvents[sixMer2index(sixMer)].size() < trainArgs.maxEvents ){
+		std::vector< double > &sixMerEvents = importedEvents[sixMer2index(sixMer)];
+		if ( sixMerEvents.size() < trainArgs.maxEvents ){
 
-			importedEvents[sixMer2index(sixMer)].push_back( eventMean );
+			sixMerEvents.push_back( eventMean );
 		}
 		if (readsRead > trainArgs.maxReads) break;
 	}
@@ -455,17 +418,22 @@ int train_main( int argc, char** argv ){
 	std::cout << "Fitting..." << std::endl;
 	
 	/*fit a mixture model to the events that aligned to each position in the reference */
-	outFile << "6mer" << '\t' << "ONT_mean" << '\t' << "ONT_stdv" << '\t' << "pi_1" << '\t' << "mean_1" << '\t' << "stdv_1" << '\t' << "pi_2" << '\t' << "mean_2" << '\t' << "stdv_2" << '\t' << "imported_events" << '\t' << "filtered_events" << std::endl;
+	outFile << "6mer" << '\t' << "ONT_mean" << '\t' << "ONT_stdv" << '\t' << "pi_1" << '\t' << "mean_1" << '\t' << "stdv_1" << '\t' << "pi_2" << '\t' << "mean_2" << '\t' << "stdv_2" << '\t' << "imported_events" << '\t' << "filtered_events" << '\n';
 	progressBar pb_fit( importedEvents.size(),true );
 
-	#pragma omp parallel for schedule(dynamic) shared(pb_fit, thymidineModel, prog, failed, outFile, importedEvents, trainArgs) num_threads(trainArgs.threads)
+	/*don't train if we have less than 200 events for this 6mer - filter these out before the parallel loop so threads are only scheduled on real fits */
+	std::vector< unsigned int > sixMersToFit;
 	for ( unsigned int i = 0; i < importedEvents.size(); i++ ){
 
-		/*don't train if we have less than 200 events for this 6mer */
-		if ( importedEvents[i].size() < 200 ){
-			prog++;
-			continue;
-		}
+		if ( importedEvents[i].size() >= 200 ) sixMersToFit.push_back(i);
+	}
+	prog = importedEvents.size() - sixMersToFit.size();
+	failed = 0;
+
+	#pragma omp parallel for schedule(dynamic) shared(pb_fit, thymidineModel, prog, failed, outFile, importedEvents, sixMersToFit, trainArgs) num_threads(trainArgs.threads)
+	for ( unsigned int fitIdx = 0; fitIdx < sixMersToFit.size(); fitIdx++ ){
+
+		unsigned int i = sixMersToFit[fitIdx];
 
 		//DBSCAN to eliminate alignment artefacts
 		unsigned int minPoints = 0.025*importedEvents[i].size();
@@ -482,11 +450,11 @@ int train_main( int argc, char** argv ){
 			continue;
 		}
 
-		std::string sixMer = intToSixmer[i];
+		std::string sixMer = index2sixMer(i);
 		double mu1, stdv1, mu2, stdv2;
 
 		/*get the ONT distribution for the mixture */
-		std::pair<double,double> meanStd = thymidineModel[sixMer2index(sixMer)];
+		std::pair<double,double> meanStd = thymidineModel[i];
 		mu1 = meanStd.first;
 		stdv1 = meanStd.second;
 
@@ -508,7 +476,7 @@ int train_main( int argc, char** argv ){
 		}
 		#pragma omp critical
 		{	
-			outFile << sixMer << '\t' << meanStd.first << '\t' << meanStd.second << '\t' << fitParameters[0] << '\t' << fitParameters[1] << '\t' << fitParameters[2] << '\t' << fitParameters[3] << '\t' << fitParameters[4] << '\t' << fitParameters[5] << '\t' << (importedEvents[i]).size() << "\t" << filteredEvents.size() << std::endl;
+			outFile << sixMer << '\t' << meanStd.first << '\t' << meanStd.second << '\t' << fitParameters[0] << '\t' << fitParameters[1] << '\t' << fitParameters[2] << '\t' << fitParameters[3] << '\t' << fitParameters[4] << '\t' << fitParameters[5] << '\t' << (importedEvents[i]).size() << "\t" << filteredEvents.size() << '\n';
 			pb_fit.displayProgress( prog, failed, 0 );
 		}
 		prog++;
@@ -94,7 +94,8 @@ def makeDetectLine(line, chromosome):
 	probBrdU = float(splitLine[2])
 	probEdU = float(splitLine[1])
 	sixMer = splitLine[2]
-	return (chromosome + ' ' + str(pos) + ' ' + str(pos+1) + ' ' + str(probBrdU) + '\n',chromosome + ' ' + str(pos) + ' ' + str(pos+1) + ' ' + str(probEdU) + '\n')
+	coords = '%s %d %d' % (chromosome, pos, pos+1)
+	return ('%s %s\n' % (coords, probBrdU), '%s %s\n' % (coords, probEdU))
 
 
 #--------------------------------------------------------------------------------------------------------------------------------------
@@ -103,7 +104,8 @@ def makeSenseLine(line, chromosome, prevPos):
 	pos = int(splitLine[0])
 	probEdUsegment = float(splitLine[1])
 	probBrdUsegment = float(splitLine[2])
-	return (chromosome + ' ' + str(prevPos) + ' ' + str(pos) + ' ' + str(probBrdUsegment) + '\n', chromosome + ' ' + str(prevPos) + ' ' + str(pos) + ' ' + str(probEdUsegment) + '\n', chromosome + ' ' + str(prevPos) + ' ' + str(pos) + ' ' + '\n')
+	coords = '%s %d %d' % (chromosome, prevPos, pos)
+	return ('%s %s\n' % (coords, probBrdUsegment), '%s %s\n' % (coords, probEdUsegment), coords + ' \n')
 
 
 #--------------------------------------------------------------------------------------------------------------------------------------
@@ -150,7 +152,7 @@ def parseBaseFile(fname, args, targetIDs):
 
 					if count % args.filesPerDir == 0:
 						directoryCount += 1
-						os.system('mkdir '+args.outDir + '/'+str(directoryCount))
+						os.mkdir(args.outDir + '/' + str(directoryCount))
 
 					count += 1
 
@@ -166,9 +168,8 @@ def parseBaseFile(fname, args, targetIDs):
 						f_bg.write( 'track type=bedGraph name="'+readID +'" description="BedGraph format" visibility=full color=200,100,0 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 						f_bg2.write( 'track type=bedGraph name="'+readID +'" description="BedGraph format" visibility=full color=93,197,186 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-						for l in buff:
-							f_bg.write(l[0])
-							f_bg2.write(l[1])
+						f_bg.write(''.join(l[0] for l in buff))
+						f_bg2.write(''.join(l[1] for l in buff))
 						f_bg.close()
 						f_bg2.close()
 
@@ -177,16 +178,14 @@ def parseBaseFile(fname, args, targetIDs):
 						f_BrdUsegment = open( args.outDir + '/' + str(readID2directory[readID]) + '/' + readID + '_BrdUsegment.bedgraph','w')
 						f_BrdUsegment.write( 'track type=bedGraph name="'+readID + '_' + strand + '_BrdUsegment'+'" description="BedGraph format" visibility=full color=200,100,0 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-						for l in buff:
-							f_BrdUsegment.write(l[0])
+						f_BrdUsegment.write(''.join(l[0] for l in buff))
 						f_BrdUsegment.close()
 
 						#rightward moving fork
 						f_EdUsegment = open( args.outDir + '/' + str(readID2directory[readID]) + '/' + readID + '_EdUsegment.bedgraph','w')
 						f_EdUsegment.write( 'track type=bedGraph name="'+readID + '_' + strand + '_EdUsegment'+'" description="BedGraph format" visibility=full color=93,197,186 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-						for l in buff:
-							f_EdUsegment.write(l[1])
+						f_EdUsegment.write(''.join(l[1] for l in buff))
 						f_EdUsegment.close()
 						
 					
@@ -235,7 +234,7 @@ def parseBaseFile(fname, args, targetIDs):
 
 		if count % args.filesPerDir == 0:
 			directoryCount += 1
-			os.system('mkdir '+args.outDir + '/'+str(directoryCount))
+			os.mkdir(args.outDir + '/' + str(directoryCount))
 
 		readID2directory[readID] = directoryCount
 
@@ -245,9 +244,8 @@ def parseBaseFile(fname, args, targetIDs):
 			f_bg.write( 'track type=bedGraph name="'+readID +'" description="BedGraph format" visibility=full color=200,100,0 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 			f_bg2.write( 'track type=bedGraph name="'+readID +'" description="BedGraph format" visibility=full color=93,197,186 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-			for l in buff:
-				f_bg.write(l[0])
-				f_bg2.write(l[1])
+			f_bg.write(''.join(l[0] for l in buff))
+			f_bg2.write(''.join(l[1] for l in buff))
 			f_bg.close()
 			f_bg2.close()
 
@@ -256,16 +254,14 @@ def parseBaseFile(fname, args, targetIDs):
 			f_BrdUsegment = open( args.outDir + '/' + str(readID2directory[readID]) + '/' + readID + '_BrdUsegment.bedgraph','w')
 			f_BrdUsegment.write( 'track type=bedGraph name="'+readID + '_' + strand + '_BrdUsegment'+'" description="BedGraph format" visibility=full color=200,100,0 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-			for l in buff:
-				f_BrdUsegment.write(l[0])
+			f_BrdUsegment.write(''.join(l[0] for l in buff))
 			f_BrdUsegment.close()
 
 			#rightward moving fork
 			f_EdUsegment = open( args.outDir + '/' + str(readID2directory[readID]) + '/' + readID + '_EdUsegment.bedgraph','w')
 			f_EdUsegment.write( 'track type=bedGraph name="'+readID + '_' + strand + '_EdUsegment'+'" description="BedGraph format" visibility=full color=93,197,186 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-			for l in buff:
-				f_EdUsegment.write(l[1])
+			f_EdUsegment.write(''.join(l[1] for l in buff))
 			f_EdUsegment.close()
 			
 	f.close()
@@ -326,16 +322,14 @@ def parseSecondaryFile(fname, readID2directory,args, targetIDs):
 							f_BrdUsegment = open( args.outDir + '/' + str(readID2directory[readID]) + '/' + readID + '_BrdUsegment.bedgraph','w')
 							f_BrdUsegment.write( 'track type=bedGraph name="'+readID + '_' + strand + '_BrdUsegment'+'" description="BedGraph format" visibility=full color=200,100,0 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-							for l in buff:
-								f_BrdUsegment.write(l[0])
+							f_BrdUsegment.write(''.join(l[0] for l in buff))
 							f_BrdUsegment.close()
 
 							#rightward moving fork
 							f_EdUsegment = open( args.outDir + '/' + str(readID2directory[readID]) + '/' + readID + '_EdUsegment.bedgraph','w')
 							f_EdUsegment.write( 'track type=bedGraph name="'+readID + '_' + strand + '_EdUsegment'+'" description="BedGraph format" visibility=full color=93,197,186 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-							for l in buff:
-								f_EdUsegment.write(l[1])
+							f_EdUsegment.write(''.join(l[1] for l in buff))
 							f_EdUsegment.close()
 							
 					
@@ -381,16 +375,14 @@ def parseSecondaryFile(fname, readID2directory,args, targetIDs):
 			f_BrdUsegment = open( args.outDir + '/' + str(readID2directory[readID]) + '/' + readID + '_BrdUsegment.bedgraph','w')
 			f_BrdUsegment.write( 'track type=bedGraph name="'+readID + '_' + strand + '_BrdUsegment'+'" description="BedGraph format" visibility=full color=200,100,0 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-			for l in buff:
-				f_BrdUsegment.write(l[0])
+			f_BrdUsegment.write(''.join(l[0] for l in buff))
 			f_BrdUsegment.close()
 
 			#rightward moving fork
 			f_EdUsegment = open( args.outDir + '/' + str(readID2directory[readID]) + '/' + readID + '_EdUsegment.bedgraph','w')
 			f_EdUsegment.write( 'track type=bedGraph name="'+readID + '_' + strand + '_EdUsegment'+'" description="BedGraph format" visibility=full color=93,197,186 altColor=0,100,200 priority=20 viewLimits=0.0:1.0'+'\n')
 
-			for l in buff:
-				f_EdUsegment.write(l[1])
+			f_EdUsegment.write(''.join(l[1] for l in buff))
 			f_EdUsegment.close()
 			
 
@@ -421,7 +413,7 @@ if os.path.isdir(args.outDir):
 	print('Output directory '+args.outDir+' already exists.  Exiting.')
 	exit(0)
 else:
-	os.system('mkdir '+args.outDir)
+	os.mkdir(args.outDir)
 
 baseFname = ""
 secondaryFname = []